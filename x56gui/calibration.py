@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import json
-import math
 from pathlib import Path
-from typing import TYPE_CHECKING
+import re
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
+
+from .storage import atomic_write_text
 
 if TYPE_CHECKING:
     from .usb_backend import DeviceInfo
@@ -21,8 +25,17 @@ CALIBRATION_COLORS: dict[str, tuple[int, int, int]] = {
     "White": (255, 255, 255),
 }
 
+_LEGACY_KEY_RE = re.compile(r"^[0-9a-f]{4}:\d+:\d+$")
+
+_PALETTE_NAMES: tuple[str, ...] = tuple(CALIBRATION_COLORS)
+_TARGET_INDEX: dict[str, int] = {name: index for index, name in enumerate(_PALETTE_NAMES)}
+_WHITE_INDEX = _TARGET_INDEX["White"]
+_CAL_PALETTE: tuple[tuple[int, int, int, int], ...] = tuple(
+    (index, *rgb) for index, rgb in enumerate(CALIBRATION_COLORS.values())
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ColorOffset:
     red: int = 0
     green: int = 0
@@ -44,42 +57,54 @@ class ColorOffset:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColorCalibration:
     order: tuple[str, str, str] = ("R", "G", "B")
     gain_r: float = 1.0
     gain_g: float = 1.0
     gain_b: float = 1.0
-    target_offsets: dict[str, ColorOffset] | None = None
-
-    def apply(self, red: int, green: int, blue: int, target_name: str | None = None) -> tuple[int, int, int]:
-        calibrated = [red, green, blue]
+    target_offsets: Mapping[str, ColorOffset] | None = None
+    _offset_table: tuple[ColorOffset | None, ...] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
         offsets = self.target_offsets or {}
-        if offsets:
-            selected_target = target_name or self.closest_target_name(red, green, blue)
-            offset = offsets.get(selected_target)
-            if offset is not None:
-                calibrated[0] = max(0, min(255, calibrated[0] + offset.red))
-                calibrated[1] = max(0, min(255, calibrated[1] + offset.green))
-                calibrated[2] = max(0, min(255, calibrated[2] + offset.blue))
+        if self.target_offsets is not None:
+            object.__setattr__(self, "target_offsets", MappingProxyType(dict(offsets)))
+        object.__setattr__(self, "_offset_table", tuple(offsets.get(name) for name in _PALETTE_NAMES))
+
+    def apply(self, red: int, green: int, blue: int, target_name: str | None = None) -> tuple[int, int, int]:
+        if not self.target_offsets:
+            return red, green, blue
 
-        return calibrated[0], calibrated[1], calibrated[2]
+        if target_name:
+            index = _TARGET_INDEX.get(target_name)
+            if index is None:
+                return red, green, blue
+        else:
+            index = _closest_target_index(red, green, blue)
+
+        offset = self._offset_table[index]
+        if offset is None:
+            return red, green, blue
+
+        out_r = red + offset.red
+        out_g = green + offset.green
+        out_b = blue + offset.blue
+        return (
+            0 if out_r < 0 else (255 if out_r > 255 else out_r),
+            0 if out_g < 0 else (255 if out_g > 255 else out_g),
+            0 if out_b < 0 else (255 if out_b > 255 else out_b),
+        )
 
     @staticmethod
     def closest_target_name(red: int, green: int, blue: int) -> str:
-        best_name = "White"
-        best_distance = float("inf")
-        for name, rgb in CALIBRATION_COLORS.items():
-            distance = math.sqrt((red - rgb[0]) ** 2 + (green - rgb[1]) ** 2 + (blue - rgb[2]) ** 2)
-            if distance < best_distance:
-                best_name = name
-                best_distance = distance
-        return best_name
+        return _PALETTE_NAMES[_closest_target_index(red, green, blue)]
 
     def offset_for(self, target_name: str) -> ColorOffset:
-        offsets = self.target_offsets or {}
-        return offsets.get(target_name, ColorOffset())
+        index = _TARGET_INDEX.get(target_name)
+        if index is None:
+            return ColorOffset()
+        return self._offset_table[index] or ColorOffset()
 
     def with_offset(self, target_name: str, offset: ColorOffset) -> ColorCalibration:
         offsets = dict(self.target_offsets or {})
@@ -123,6 +148,22 @@ class ColorCalibration:
         )
 
 
+@lru_cache(maxsize=8192)
+def _closest_target_index(red: int, green: int, blue: int) -> int:
+    best_index = _WHITE_INDEX
+    best_distance = 3 * 256 * 256
+    for index, pal_r, pal_g, pal_b in _CAL_PALETTE:
+        distance = (
+            (red - pal_r) * (red - pal_r)
+            + (green - pal_g) * (green - pal_g)
+            + (blue - pal_b) * (blue - pal_b)
+        )
+        if distance < best_distance:
+            best_index = index
+            best_distance = distance
+    return best_index
+
+
 def _to_int(value: object, default: int) -> int:
     try:
         return int(value)
@@ -147,6 +188,8 @@ class CalibrationStore:
     def __init__(self) -> None:
         self._path = self._resolve_path()
         self._profiles: dict[str, ColorCalibration] = {}
+        self._saved_text: str | None = None
+        self._version = 0
         self._load()
 
     @staticmethod
@@ -159,15 +202,11 @@ class CalibrationStore:
     def key_for_device(device: DeviceInfo) -> str:
         return f"{device.product_id:04x}"
 
-    @staticmethod
-    def _legacy_key_for_device(device: DeviceInfo) -> str:
-        return f"{device.product_id:04x}:{device.bus}:{device.address}"
-
     def _load(self) -> None:
         try:
             if not self._path.exists():
                 return
-            raw = json.loads(self._path.read_text(encoding="utf-8"))
+            raw = json.loads(self._path.read_bytes())
             if not isinstance(raw, dict):
                 return
             profiles_raw = raw.get("profiles", {})
@@ -181,46 +220,50 @@ class CalibrationStore:
             self._profiles = loaded
         except (OSError, json.JSONDecodeError, ValueError):
             self._profiles = {}
+            return
+
+        self._migrate_legacy_keys()
+
+    def _migrate_legacy_keys(self) -> None:
+        legacy_keys = [key for key in self._profiles if _LEGACY_KEY_RE.match(key)]
+        if not legacy_keys:
+            return
+
+        for legacy_key in legacy_keys:
+            calibration = self._profiles.pop(legacy_key)
+            self._profiles.setdefault(legacy_key.split(":", 1)[0], calibration)
+
+        try:
+            self._save()
+        except OSError:
+            pass
 
     def _save(self) -> None:
         payload = {
             "profiles": {k: v.to_json() for k, v in self._profiles.items()}
         }
-        self._path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        text = json.dumps(payload, indent=2)
+        if text == self._saved_text:
+            return
 
-    def get_for_device(self, device: DeviceInfo) -> ColorCalibration | None:
-        key = self.key_for_device(device)
-        direct = self._profiles.get(key)
-        if direct is not None:
-            return direct
-
-        legacy_key = self._legacy_key_for_device(device)
-        legacy = self._profiles.get(legacy_key)
-        if legacy is not None:
-            self._profiles[key] = legacy
-            self._save()
-            return legacy
-        return None
+        atomic_write_text(self._path, text)
+        self._saved_text = text
 
-    def set_for_device(self, device: DeviceInfo, calibration: ColorCalibration) -> None:
-        key = self.key_for_device(device)
-        self._profiles[key] = calibration
+    @property
+    def version(self) -> int:
+        return self._version
 
-        legacy_key = self._legacy_key_for_device(device)
-        if legacy_key in self._profiles:
-            del self._profiles[legacy_key]
+    def get_for_device(self, device: DeviceInfo) -> ColorCalibration | None:
+        return self._profiles.get(self.key_for_device(device))
 
+    def set_for_device(self, device: DeviceInfo, calibration: ColorCalibration) -> None:
+        self._profiles[self.key_for_device(device)] = calibration
+        self._version += 1
         self._save()
 
     def reset_for_device(self, device: DeviceInfo) -> None:
         key = self.key_for_device(device)
-        legacy_key = self._legacy_key_for_device(device)
-        changed = False
         if key in self._profiles:
             del self._profiles[key]
-            changed = True
-        if legacy_key in self._profiles:
-            del self._profiles[legacy_key]
-            changed = True
-        if changed:
+            self._version += 1
             self._save()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import colorsys
 import math
 
 
@@ -9,6 +8,20 @@ EFFECT_RAINBOW = "rainbow"
 
 EFFECT_MODES = [EFFECT_OFF, EFFECT_RAINBOW]
 
+_TWO_PI = 2.0 * math.pi
+_TWO_PI_RECIP = 1.0 / _TWO_PI
+
+# HSV -> RGB with full saturation: per hue sextant, which of (v, q, t, 0)
+# feeds the red, green and blue channels.
+_RAINBOW_SECTORS = (
+    (0, 2, 3),
+    (1, 0, 3),
+    (3, 0, 2),
+    (3, 1, 0),
+    (2, 3, 0),
+    (0, 3, 1),
+)
+
 
 def compute_effect_color(
     mode: str,
@@ -17,12 +30,16 @@ def compute_effect_color(
     brightness: float,
 ) -> tuple[int, int, int]:
     if mode == EFFECT_RAINBOW:
-        hue = (phase / (2.0 * math.pi)) % 1.0
-        red, green, blue = colorsys.hsv_to_rgb(hue, 1.0, max(0.05, min(1.0, brightness)))
+        hue6 = phase * _TWO_PI_RECIP * 6.0
+        sector = int(hue6)
+        fraction = hue6 - sector
+        value = max(0.05, min(1.0, brightness))
+        channels = (value, value * (1.0 - fraction), value * (1.0 - (1.0 - fraction)), 0.0)
+        r_index, g_index, b_index = _RAINBOW_SECTORS[sector % 6]
         return (
-            _clamp_rgb(round(red * 255.0)),
-            _clamp_rgb(round(green * 255.0)),
-            _clamp_rgb(round(blue * 255.0)),
+            _clamp_rgb(round(channels[r_index] * 255.0)),
+            _clamp_rgb(round(channels[g_index] * 255.0)),
+            _clamp_rgb(round(channels[b_index] * 255.0)),
         )
 
     return base_rgb
@@ -30,8 +47,10 @@ def compute_effect_color(
 
 def next_phase(phase: float, speed: int) -> float:
     step = 0.02 * max(1, min(20, speed))
-    return phase + step
+    phase += step
+    return phase - _TWO_PI if phase >= _TWO_PI else phase
 
 
 def _clamp_rgb(value: int) -> int:
-    return max(0, min(255, int(value)))
+    value = int(value)
+    return 0 if value < 0 else (255 if value > 255 else value)
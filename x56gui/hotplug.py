@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from PyQt6.QtCore import QObject, QSocketNotifier, pyqtSignal
+
+from .protocol import SUPPORTED_PRODUCTS, VENDOR_ID
+
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+
+class HotplugMonitor(QObject):
+    device_event = pyqtSignal()
+
+    def __init__(self, monitor: pyudev.Monitor, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._monitor = monitor
+        self._notifier = QSocketNotifier(monitor.fileno(), QSocketNotifier.Type.Read, self)
+        self._notifier.activated.connect(self._on_activated)
+
+    def _on_activated(self) -> None:
+        changed = False
+        while True:
+            device = self._monitor.poll(timeout=0)
+            if device is None:
+                break
+            if device.action in ("add", "remove") and _is_x56_device(device):
+                changed = True
+        if changed:
+            self.device_event.emit()
+
+
+def create_hotplug_monitor(parent: QObject | None = None) -> HotplugMonitor | None:
+    if pyudev is None:
+        return None
+
+    try:
+        monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+        monitor.filter_by(subsystem="usb", device_type="usb_device")
+        monitor.start()
+    except (OSError, ImportError):
+        return None
+    return HotplugMonitor(monitor, parent)
+
+
+def _is_x56_device(device: pyudev.Device) -> bool:
+    product = device.get("PRODUCT", "")
+    parts = product.split("/")
+    if len(parts) < 2:
+        return False
+    try:
+        vendor_id = int(parts[0], 16)
+        product_id = int(parts[1], 16)
+    except ValueError:
+        return False
+    return vendor_id == VENDOR_ID and product_id in SUPPORTED_PRODUCTS
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
+import threading
+import time
 
-from PyQt6.QtCore import QTimer
-from PyQt6.QtGui import QAction, QCloseEvent, QColor, QIcon
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QAction, QCloseEvent, QColor, QHideEvent, QIcon, QShowEvent
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
+    QApplication,
     QComboBox,
     QCheckBox,
     QColorDialog,
@@ -31,13 +35,14 @@ from PyQt6.QtWidgets import (
 
 from .calibration import CALIBRATION_COLORS, CalibrationStore, ColorCalibration, ColorOffset
 from .effects import EFFECT_MODES, EFFECT_OFF, compute_effect_color, next_phase
+from .hotplug import create_hotplug_monitor
 from .profile_store import DeviceDefaultProfile, ProfileStore
 from .protocol import SUPPORTED_PRODUCTS
 from .startup import disable as disable_autostart
 from .startup import enable as enable_autostart
 from .startup import is_enabled as is_autostart_enabled
 from .udev import has_x56_udev_rule, install_x56_udev_rule, should_manage_udev
-from .usb_backend import BackendError, DeviceInfo, X56UsbBackend
+from .usb_backend import BackendError, DeviceInfo, DeviceScan, X56UsbBackend
 
 
 PRESETS: list[tuple[str, tuple[int, int, int]]] = [
@@ -48,10 +53,18 @@ PRESETS: list[tuple[str, tuple[int, int, int]]] = [
     ("Amber", (255, 128, 0)),
 ]
 
+MIN_POLL_INTERVAL_MS = 250
 
-@dataclass
+_SORTED_PRODUCTS: tuple[tuple[int, str], ...] = tuple(sorted(SUPPORTED_PRODUCTS.items()))
+_SORTED_PRODUCT_IDS: tuple[int, ...] = tuple(product_id for product_id, _ in _SORTED_PRODUCTS)
+
+
+SessionKey = tuple[str, int]
+
+
+@dataclass(slots=True)
 class EffectSession:
-    key: str
+    key: SessionKey
     mode: str
     speed: int
     brightness: int
@@ -61,6 +74,90 @@ class EffectSession:
     phase: float = 0.0
 
 
+class EffectWorker(QObject):
+    _drain_requested = pyqtSignal()
+
+    def __init__(self, backend: X56UsbBackend) -> None:
+        super().__init__()
+        self._backend = backend
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._pending: dict[
+            SessionKey,
+            tuple[int, list[int], tuple[int, int, int], dict[int, ColorCalibration]],
+        ] = {}
+        self._drain_scheduled = False
+        self._drain_requested.connect(self._drain)
+
+    def submit(
+        self,
+        session_key: SessionKey,
+        generation: int,
+        target_ids: list[int],
+        rgb: tuple[int, int, int],
+        calibrations: dict[int, ColorCalibration],
+    ) -> None:
+        with self._lock:
+            self._pending[session_key] = (generation, target_ids, rgb, calibrations)
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        self._drain_requested.emit()
+
+    def discard(self, session_key: SessionKey) -> None:
+        with self._send_lock:
+            with self._lock:
+                self._pending.pop(session_key, None)
+
+    def discard_pending(self) -> None:
+        with self._send_lock:
+            with self._lock:
+                self._pending.clear()
+
+    @pyqtSlot()
+    def _drain(self) -> None:
+        while True:
+            with self._send_lock:
+                with self._lock:
+                    if not self._pending:
+                        self._drain_scheduled = False
+                        return
+                    session_key = next(iter(self._pending))
+                    generation, target_ids, rgb, calibrations = self._pending.pop(session_key)
+
+                try:
+                    self._backend.set_rgb_many(
+                        target_ids,
+                        rgb[0],
+                        rgb[1],
+                        rgb[2],
+                        calibrations=calibrations,
+                        generation=generation,
+                    )
+                except BackendError:
+                    continue
+
+
+class _RefreshSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class _RefreshTask(QRunnable):
+    def __init__(self, backend: X56UsbBackend) -> None:
+        super().__init__()
+        self._backend = backend
+        self.signals = _RefreshSignals()
+
+    def run(self) -> None:
+        try:
+            scan = self._backend.scan()
+        except BackendError as exc:
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.finished.emit(scan)
+
+
 class CalibrationDialog(QDialog):
     def __init__(
         self,
@@ -82,8 +179,7 @@ class CalibrationDialog(QDialog):
 
         self.device_combo = QComboBox()
         for device in devices:
-            label = f"{device.id}: {device.name} (bus {device.bus}, device {device.address})"
-            self.device_combo.addItem(label, userData=device.id)
+            self.device_combo.addItem(device.label, userData=device.id)
         self.device_combo.currentIndexChanged.connect(self._load_current_profile)
         form.addRow("Device", self.device_combo)
 
@@ -214,12 +310,21 @@ class MainWindow(QMainWindow):
         self.calibration_store = CalibrationStore()
         self.profile_store = ProfileStore()
         self._devices: list[DeviceInfo] = []
+        self._devices_by_product: dict[int, list[int]] = {}
+        self._devices_by_id: dict[int, DeviceInfo] = {}
         self._udev_prompted = False
         self._start_hidden = start_hidden
         self._quitting = False
+        self._pause_effects_when_hidden = False
+        self._color_dialog: QColorDialog | None = None
+        self._last_refresh_ns = 0
+        self._refresh_task: _RefreshTask | None = None
+        self._refresh_requeued = False
         self._detected_keys: set[tuple[int, int, int]] = set()
         self._profile_controls: dict[int, dict[str, object]] = {}
-        self._effect_sessions: dict[str, EffectSession] = {}
+        self._effect_sessions: dict[SessionKey, EffectSession] = {}
+        self._calibration_cache: dict[frozenset[int], dict[int, ColorCalibration]] = {}
+        self._calibration_cache_version = -1
 
         self.setWindowTitle("X-56 RGB Utility")
         self.setMinimumWidth(760)
@@ -227,6 +332,7 @@ class MainWindow(QMainWindow):
         self._build_ui()
         self._build_tray()
         self._load_default_profiles_ui()
+        self._start_effect_worker()
         self.refresh_devices()
         self._auto_apply_default_profiles(new_only=False)
         self._start_detection_poll()
@@ -288,7 +394,7 @@ class MainWindow(QMainWindow):
         rgb_layout.addWidget(self.apply_button, 4, 1)
 
         self.copy_default_device_combo = QComboBox()
-        for product_id, product_name in sorted(SUPPORTED_PRODUCTS.items()):
+        for product_id, product_name in _SORTED_PRODUCTS:
             self.copy_default_device_combo.addItem(product_name, userData=product_id)
 
         self.copy_to_default_button = QPushButton("Copy to selected default")
@@ -324,7 +430,7 @@ class MainWindow(QMainWindow):
         profiles_layout.addWidget(QLabel("Action"), 0, 8)
 
         row_index = 1
-        for product_id, product_name in sorted(SUPPORTED_PRODUCTS.items()):
+        for product_id, product_name in _SORTED_PRODUCTS:
             enabled_box = QCheckBox()
             red_spin = self._make_rgb_spinbox()
             green_spin = self._make_rgb_spinbox()
@@ -384,7 +490,16 @@ class MainWindow(QMainWindow):
         return spin
 
     def refresh_devices(self, show_errors: bool = True) -> None:
+        self._last_refresh_ns = time.monotonic_ns()
+        try:
+            devices = self.backend.refresh()
+        except BackendError as exc:
+            if show_errors:
+                self._show_error(str(exc))
+            return
+        self._apply_devices(devices)
 
+    def _apply_devices(self, devices: list[DeviceInfo]) -> None:
         selected_keys: set[tuple[int, int, int]] = set()
         if not self.all_devices_checkbox.isChecked():
             for item in self.device_list.selectedItems():
@@ -392,34 +507,36 @@ class MainWindow(QMainWindow):
                 if isinstance(key, tuple) and len(key) == 3:
                     selected_keys.add((int(key[0]), int(key[1]), int(key[2])))
 
+        self._devices = devices
+        self._calibration_cache.clear()
+        row_by_key: dict[tuple[int, int, int], int] = {}
+        self.device_list.setUpdatesEnabled(False)
         try:
-            self._devices = self.backend.refresh()
-        except BackendError as exc:
-            if show_errors:
-                self._show_error(str(exc))
-            return
-
-        self.device_list.clear()
-
+            self.device_list.clear()
+            for row, dev in enumerate(self._devices):
+                key = (dev.product_id, dev.bus, dev.address)
+                item = QListWidgetItem(dev.label)
+                item.setData(Qt.ItemDataRole.UserRole, dev.id)
+                item.setData(Qt.ItemDataRole.UserRole + 1, key)
+                self.device_list.addItem(item)
+                row_by_key[key] = row
+        finally:
+            self.device_list.setUpdatesEnabled(True)
+
+        self._detected_keys = set(row_by_key)
+        self._devices_by_product = {}
         for dev in self._devices:
-            label = f"{dev.id}: {dev.name} (bus {dev.bus}, device {dev.address})"
-            item = QListWidgetItem(label)
-            item.setData(Qt.ItemDataRole.UserRole, dev.id)
-            item.setData(Qt.ItemDataRole.UserRole + 1, (dev.product_id, dev.bus, dev.address))
-            self.device_list.addItem(item)
-
-        self._detected_keys = {(dev.product_id, dev.bus, dev.address) for dev in self._devices}
+            self._devices_by_product.setdefault(dev.product_id, []).append(dev.id)
+        self._devices_by_id = {dev.id: dev for dev in self._devices}
 
         if self._devices:
             if self.all_devices_checkbox.isChecked():
                 self._select_all_list_items()
             else:
-                for index in range(self.device_list.count()):
-                    item = self.device_list.item(index)
-                    key = item.data(Qt.ItemDataRole.UserRole + 1)
-                    if isinstance(key, tuple) and len(key) == 3:
-                        if (int(key[0]), int(key[1]), int(key[2])) in selected_keys:
-                            item.setSelected(True)
+                for key in selected_keys:
+                    row = row_by_key.get(key)
+                    if row is not None:
+                        self.device_list.item(row).setSelected(True)
             self.status_label.setText(f"Found {len(self._devices)} compatible device(s).")
         else:
             self.status_label.setText("No compatible devices found.")
@@ -427,8 +544,15 @@ class MainWindow(QMainWindow):
         self._on_all_devices_toggled(self.all_devices_checkbox.isChecked())
 
     def pick_color(self) -> None:
-        current = QColor(self.red_spin.value(), self.green_spin.value(), self.blue_spin.value())
-        chosen = QColorDialog.getColor(current, self, "Select RGB Color")
+        if self._color_dialog is None:
+            self._color_dialog = QColorDialog(self)
+            self._color_dialog.setWindowTitle("Select RGB Color")
+        self._color_dialog.setCurrentColor(
+            QColor(self.red_spin.value(), self.green_spin.value(), self.blue_spin.value())
+        )
+        if self._color_dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        chosen = self._color_dialog.selectedColor()
         if not chosen.isValid():
             return
         self.red_spin.setValue(chosen.red())
@@ -446,22 +570,29 @@ class MainWindow(QMainWindow):
         if selected_product_id is None:
             self._show_error("No default profile target selected.")
             return
-        self._copy_current_color_to_default(int(selected_product_id))
+        product_id = int(selected_product_id)
+        if self._copy_current_color_to_controls(product_id):
+            self._save_default_profile_for(product_id)
 
     def copy_color_to_all_defaults(self) -> None:
-        for product_id in sorted(SUPPORTED_PRODUCTS.keys()):
-            self._copy_current_color_to_default(product_id)
+        profiles: dict[int, DeviceDefaultProfile] = {}
+        for product_id in _SORTED_PRODUCT_IDS:
+            if self._copy_current_color_to_controls(product_id):
+                profile = self._profile_from_controls(product_id)
+                if profile is not None:
+                    profiles[product_id] = profile
+        self.profile_store.set_many(profiles)
         self.status_label.setText("Copied current RGB to all default profiles.")
         self._tray_message("X-56 Defaults", "Copied current RGB to all default profiles.")
 
-    def _copy_current_color_to_default(self, product_id: int) -> None:
+    def _copy_current_color_to_controls(self, product_id: int) -> bool:
         controls = self._profile_controls.get(product_id)
         if controls is None:
-            return
+            return False
         controls["red"].setValue(self.red_spin.value())
         controls["green"].setValue(self.green_spin.value())
         controls["blue"].setValue(self.blue_spin.value())
-        self._save_default_profile_for(product_id)
+        return True
 
     def apply_rgb(self) -> None:
         if not self._devices:
@@ -528,6 +659,14 @@ class MainWindow(QMainWindow):
             return
         event.accept()
 
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        self._update_effect_timer()
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        super().hideEvent(event)
+        self._update_effect_timer()
+
     def _build_tray(self) -> None:
         if not QSystemTrayIcon.isSystemTrayAvailable():
             if self._start_hidden:
@@ -553,6 +692,12 @@ class MainWindow(QMainWindow):
         stop_effects_action.triggered.connect(self.stop_all_effects)
         menu.addAction(stop_effects_action)
 
+        pause_hidden_action = QAction("Pause effects when hidden", self)
+        pause_hidden_action.setCheckable(True)
+        pause_hidden_action.setChecked(self._pause_effects_when_hidden)
+        pause_hidden_action.toggled.connect(self._toggle_pause_effects_when_hidden)
+        menu.addAction(pause_hidden_action)
+
         self.autostart_action = QAction("Start on login", self)
         self.autostart_action.setCheckable(True)
         self.autostart_action.setChecked(is_autostart_enabled())
@@ -598,10 +743,20 @@ class MainWindow(QMainWindow):
     def _quit_from_tray(self) -> None:
         self._quitting = True
         self._effect_sessions.clear()
+        self._update_effect_timer()
+        self._effect_worker.discard_pending()
         if getattr(self, "tray", None) is not None:
             self.tray.hide()
         self.close()
 
+    def _toggle_pause_effects_when_hidden(self, checked: bool) -> None:
+        self._pause_effects_when_hidden = checked
+        if checked:
+            self.status_label.setText("Effects pause while the window is hidden.")
+        else:
+            self.status_label.setText("Effects keep running while the window is hidden.")
+        self._update_effect_timer()
+
     def _toggle_autostart(self, checked: bool) -> None:
         try:
             if checked:
@@ -616,35 +771,98 @@ class MainWindow(QMainWindow):
                 self.autostart_action.setChecked(is_autostart_enabled())
 
     def _start_detection_poll(self) -> None:
+        self.deferred_poll_timer = QTimer(self)
+        self.deferred_poll_timer.setSingleShot(True)
+        self.deferred_poll_timer.timeout.connect(self._poll_devices)
+        QApplication.instance().aboutToQuit.connect(self._wait_for_refresh)
+
+        self.hotplug_monitor = create_hotplug_monitor(self)
+        if self.hotplug_monitor is not None:
+            self.hotplug_timer = QTimer(self)
+            self.hotplug_timer.setSingleShot(True)
+            self.hotplug_timer.setInterval(500)
+            self.hotplug_timer.timeout.connect(self._poll_devices)
+            self.hotplug_monitor.device_event.connect(self.hotplug_timer.start)
+            return
+
         self.poll_timer = QTimer(self)
         self.poll_timer.setInterval(4000)
         self.poll_timer.timeout.connect(self._poll_devices)
         self.poll_timer.start()
 
+    def _wait_for_refresh(self) -> None:
+        QThreadPool.globalInstance().waitForDone()
+
+    def _start_effect_worker(self) -> None:
+        self._effect_thread = QThread(self)
+        self._effect_worker = EffectWorker(self.backend)
+        self._effect_worker.moveToThread(self._effect_thread)
+        self._effect_thread.start()
+        QApplication.instance().aboutToQuit.connect(self._stop_effect_worker)
+
+    def _stop_effect_worker(self) -> None:
+        self._effect_worker.discard_pending()
+        self._effect_thread.quit()
+        self._effect_thread.wait()
+
     def _start_effect_timer(self) -> None:
         self.effect_timer = QTimer(self)
         self.effect_timer.setInterval(180)
         self.effect_timer.timeout.connect(self._effect_tick)
-        self.effect_timer.start()
+        self._update_effect_timer()
+
+    def _update_effect_timer(self) -> None:
+        timer = getattr(self, "effect_timer", None)
+        if timer is None:
+            return
+        paused = self._pause_effects_when_hidden and not self.isVisible()
+        if self._effect_sessions and not paused:
+            if not timer.isActive():
+                timer.start()
+        elif timer.isActive():
+            timer.stop()
 
     def _poll_devices(self) -> None:
-        previous = set(self._detected_keys)
-        self.refresh_devices(show_errors=False)
-        current = set(self._detected_keys)
-        newly_detected = current - previous
+        elapsed_ms = (time.monotonic_ns() - self._last_refresh_ns) // 1_000_000
+        if elapsed_ms < MIN_POLL_INTERVAL_MS:
+            if not self.deferred_poll_timer.isActive():
+                self.deferred_poll_timer.start(MIN_POLL_INTERVAL_MS - elapsed_ms)
+            return
+        if self._refresh_task is not None:
+            self._refresh_requeued = True
+            return
+
+        self._last_refresh_ns = time.monotonic_ns()
+        task = _RefreshTask(self.backend)
+        task.signals.finished.connect(self._on_poll_refreshed)
+        task.signals.failed.connect(self._on_poll_finished)
+        self._refresh_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_poll_refreshed(self, scan: DeviceScan) -> None:
+        previous = self._detected_keys
+        self._apply_devices(self.backend.install(scan))
+        newly_detected = self._detected_keys - previous
         if newly_detected:
             self._auto_apply_default_profiles(new_only=True, new_keys=newly_detected)
+        self._on_poll_finished()
+
+    def _on_poll_finished(self, _error: str = "") -> None:
+        self._refresh_task = None
+        if self._refresh_requeued:
+            self._refresh_requeued = False
+            self.deferred_poll_timer.start(MIN_POLL_INTERVAL_MS)
 
     def _resolved_target_ids(self, session: EffectSession) -> list[int]:
         if session.product_id is not None:
-            return [dev.id for dev in self._devices if dev.product_id == session.product_id]
-        valid = {dev.id for dev in self._devices}
-        return [device_id for device_id in session.target_ids if device_id in valid]
+            return list(self._devices_by_product.get(session.product_id, ()))
+        return [device_id for device_id in session.target_ids if device_id in self._devices_by_id]
 
     def _effect_tick(self) -> None:
         if not self._effect_sessions or not self._devices:
             return
 
+        generation = self.backend.generation
         session_keys = list(self._effect_sessions.keys())
         for session_key in session_keys:
             session = self._effect_sessions.get(session_key)
@@ -652,6 +870,9 @@ class MainWindow(QMainWindow):
                 continue
             if session.mode == EFFECT_OFF:
                 del self._effect_sessions[session_key]
+                self._effect_worker.discard(session_key)
+                if not self._effect_sessions:
+                    self._update_effect_timer()
                 continue
 
             target_ids = self._resolved_target_ids(session)
@@ -665,20 +886,13 @@ class MainWindow(QMainWindow):
                 session.brightness / 100.0,
             )
             calibration_map = self._build_calibration_map(target_ids)
-            try:
-                _, failures = self.backend.set_rgb_many(
-                    target_ids,
-                    out_rgb[0],
-                    out_rgb[1],
-                    out_rgb[2],
-                    calibrations=calibration_map,
-                )
-            except BackendError as exc:
-                continue
+            self._effect_worker.submit(session_key, generation, target_ids, out_rgb, calibration_map)
             session.phase = next_phase(session.phase, session.speed)
 
     def stop_all_effects(self) -> None:
         self._effect_sessions.clear()
+        self._update_effect_timer()
+        self._effect_worker.discard_pending()
         self.status_label.setText("Stopped all effects.")
         self._tray_message("X-56 Effects", "Stopped all effects.")
 
@@ -704,9 +918,18 @@ class MainWindow(QMainWindow):
             effect_brightness_spin.setValue(profile.effect_brightness)
 
     def _save_default_profile_for(self, product_id: int) -> None:
+        profile = self._profile_from_controls(product_id)
+        if profile is None:
+            return
+        self.profile_store.set(product_id, profile)
+        message = f"Saved default profile for {SUPPORTED_PRODUCTS[product_id]}."
+        self.status_label.setText(message)
+        self._tray_message("X-56 Defaults", message)
+
+    def _profile_from_controls(self, product_id: int) -> DeviceDefaultProfile | None:
         controls = self._profile_controls.get(product_id)
         if controls is None:
-            return
+            return None
 
         enabled_box = controls["enabled"]
         red_spin = controls["red"]
@@ -719,7 +942,7 @@ class MainWindow(QMainWindow):
         effect_mode = effect_mode_combo.currentData()
         effect_enabled = effect_mode is not None and effect_mode != EFFECT_OFF
 
-        profile = DeviceDefaultProfile(
+        return DeviceDefaultProfile(
             enabled=bool(enabled_box.isChecked()),
             name="Default",
             red=int(red_spin.value()),
@@ -730,12 +953,6 @@ class MainWindow(QMainWindow):
             effect_speed=int(effect_speed_spin.value()),
             effect_brightness=int(effect_brightness_spin.value()),
         )
-        self.profile_store.set(product_id, profile)
-        self.status_label.setText(f"Saved default profile for {SUPPORTED_PRODUCTS[product_id]}.")
-        self._tray_message(
-            "X-56 Defaults",
-            f"Saved default profile for {SUPPORTED_PRODUCTS[product_id]}.",
-        )
 
     def _auto_apply_default_profiles(
         self,
@@ -745,31 +962,28 @@ class MainWindow(QMainWindow):
         if not self._devices:
             return
 
-        by_product: dict[int, list[int]] = {}
-        for device in self._devices:
-            by_product.setdefault(device.product_id, []).append(device.id)
+        new_by_product: defaultdict[int, list[int]] = defaultdict(list)
+        if new_only and new_keys:
+            for dev in self._devices:
+                if (dev.product_id, dev.bus, dev.address) in new_keys:
+                    new_by_product[dev.product_id].append(dev.id)
 
-        for product_id, device_ids in by_product.items():
+        for product_id, device_ids in self._devices_by_product.items():
+            session_key = ("profile", product_id)
             profile = self.profile_store.get(product_id)
             if not profile.enabled:
-                self._effect_sessions.pop(f"profile:{product_id}", None)
+                self._effect_sessions.pop(session_key, None)
+                self._effect_worker.discard(session_key)
                 continue
 
-            target_ids = device_ids
-            if new_only:
-                new_ids: list[int] = []
-                for dev in self._devices:
-                    key = (dev.product_id, dev.bus, dev.address)
-                    if dev.product_id == product_id and new_keys is not None and key in new_keys:
-                        new_ids.append(dev.id)
-                target_ids = new_ids
-
+            target_ids = new_by_product.get(product_id) if new_only else device_ids
             if not target_ids:
                 continue
+            product_name = SUPPORTED_PRODUCTS[product_id]
 
             if profile.effect_enabled and profile.effect_mode in EFFECT_MODES and profile.effect_mode != EFFECT_OFF:
-                self._effect_sessions[f"profile:{product_id}"] = EffectSession(
-                    key=f"profile:{product_id}",
+                self._effect_sessions[session_key] = EffectSession(
+                    key=session_key,
                     mode=profile.effect_mode,
                     speed=profile.effect_speed,
                     brightness=profile.effect_brightness,
@@ -779,10 +993,11 @@ class MainWindow(QMainWindow):
                     phase=0.0,
                 )
                 self.status_label.setText(
-                    f"Started default {profile.effect_mode} effect for {SUPPORTED_PRODUCTS[product_id]}."
+                    f"Started default {profile.effect_mode} effect for {product_name}."
                 )
                 continue
-            self._effect_sessions.pop(f"profile:{product_id}", None)
+            self._effect_sessions.pop(session_key, None)
+            self._effect_worker.discard(session_key)
 
             calibration_map = self._build_calibration_map(target_ids)
             applied, failures = self.backend.set_rgb_many(
@@ -795,17 +1010,15 @@ class MainWindow(QMainWindow):
             if failures:
                 self._tray_message(
                     "X-56 Defaults",
-                    f"{SUPPORTED_PRODUCTS[product_id]}: {len(failures)} device(s) failed while applying defaults.",
+                    f"{product_name}: {len(failures)} device(s) failed while applying defaults.",
                     QSystemTrayIcon.MessageIcon.Warning,
                 )
             if applied:
-                self.status_label.setText(
-                    f"Applied default profile to {applied} {SUPPORTED_PRODUCTS[product_id]} device(s)."
-                )
-                self._tray_message(
-                    "X-56 Defaults",
-                    f"Applied default profile to {applied} {SUPPORTED_PRODUCTS[product_id]} device(s).",
-                )
+                message = f"Applied default profile to {applied} {product_name} device(s)."
+                self.status_label.setText(message)
+                self._tray_message("X-56 Defaults", message)
+
+        self._update_effect_timer()
 
     def _on_all_devices_toggled(self, checked: bool) -> None:
         self.device_list.setEnabled(not checked)
@@ -826,18 +1039,28 @@ class MainWindow(QMainWindow):
         return ids
 
     def _build_calibration_map(self, target_ids: list[int]) -> dict[int, ColorCalibration]:
+        version = self.calibration_store.version
+        if version != self._calibration_cache_version:
+            self._calibration_cache.clear()
+            self._calibration_cache_version = version
+
+        cache_key = frozenset(target_ids)
+        cached = self._calibration_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         if 0 in target_ids:
-            target_set = {device.id for device in self._devices}
+            targets = self._devices
         else:
-            target_set = set(target_ids)
+            devices_by_id = self._devices_by_id
+            targets = [devices_by_id[i] for i in cache_key if i in devices_by_id]
 
         calibration_map: dict[int, ColorCalibration] = {}
-        for device in self._devices:
-            if device.id not in target_set:
-                continue
+        for device in targets:
             calibration = self.calibration_store.get_for_device(device)
             if calibration is not None:
                 calibration_map[device.id] = calibration
+        self._calibration_cache[cache_key] = calibration_map
         return calibration_map
 
     def open_calibration_dialog(self) -> None:
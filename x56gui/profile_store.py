@@ -7,9 +7,10 @@ from typing import Any
 
 from .effects import EFFECT_MODES, EFFECT_OFF
 from .protocol import SUPPORTED_PRODUCTS
+from .storage import atomic_write_text
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeviceDefaultProfile:
     enabled: bool = False
     name: str = "Default"
@@ -65,7 +66,7 @@ class ProfileStore:
         try:
             if not self._path.exists():
                 return
-            raw = json.loads(self._path.read_text(encoding="utf-8"))
+            raw = json.loads(self._path.read_bytes())
             if not isinstance(raw, dict):
                 return
             profiles_raw = raw.get("profiles", {})
@@ -87,7 +88,7 @@ class ProfileStore:
         payload = {
             "profiles": {k: v.to_json() for k, v in self._profiles.items()}
         }
-        self._path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        atomic_write_text(self._path, json.dumps(payload, indent=2))
 
     @staticmethod
     def _key(product_id: int) -> str:
@@ -98,9 +99,22 @@ class ProfileStore:
         return self._profiles.get(key, DeviceDefaultProfile())
 
     def set(self, product_id: int, profile: DeviceDefaultProfile) -> None:
-        self._profiles[self._key(product_id)] = profile
+        key = self._key(product_id)
+        if self._profiles.get(key) == profile:
+            return
+        self._profiles[key] = profile
         self._save()
 
+    def set_many(self, profiles: dict[int, DeviceDefaultProfile]) -> None:
+        changed = False
+        for product_id, profile in profiles.items():
+            key = self._key(product_id)
+            if self._profiles.get(key) != profile:
+                self._profiles[key] = profile
+                changed = True
+        if changed:
+            self._save()
+
     def get_known_products(self) -> list[int]:
         return sorted(SUPPORTED_PRODUCTS.keys())
 
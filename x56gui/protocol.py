@@ -16,12 +16,12 @@ WINDEX_INTERFACE_2 = 2 << 8
 
 PACKET_SIZE = 64
 
+_RGB_TEMPLATE = bytes([0x09, 0x00, 0x03]) + bytes(PACKET_SIZE - 3)
+_APPLY_TEMPLATE = bytes([0x01, 0x01]) + bytes(PACKET_SIZE - 2)
+
 
 def build_rgb_packet(red: int, green: int, blue: int) -> bytearray:
-    packet = bytearray(PACKET_SIZE)
-    packet[0] = 0x09
-    packet[1] = 0x00
-    packet[2] = 0x03
+    packet = bytearray(_RGB_TEMPLATE)
     packet[3] = red
     packet[4] = green
     packet[5] = blue
@@ -29,7 +29,4 @@ def build_rgb_packet(red: int, green: int, blue: int) -> bytearray:
 
 
 def build_apply_packet() -> bytearray:
-    packet = bytearray(PACKET_SIZE)
-    packet[0] = 0x01
-    packet[1] = 0x01
-    return packet
+    return bytearray(_APPLY_TEMPLATE)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 import shlex
 import sys
@@ -59,39 +60,23 @@ def _preferred_python_executable() -> Path:
     return Path(sys.executable)
 
 
+@cache
 def _is_arch_linux() -> bool:
-    try:
-        with open("/etc/os-release", "r", encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("ID_LIKE=") and "arch" in line.lower():
-                    return True
-                if line.startswith("ID=") and "arch" in line.lower():
-                    return True
-    except OSError:
-        pass
-    return False
-
-# def get_os_release():
-#     data = {}
-#     path = Path("/etc/os-release")
-
-#     if not path.exists():
-#         return data
-
-#     with path.open() as f:
-#         for line in f:
-#             if "=" not in line:
-#                 continue
-#             key, value = line.strip().split("=", 1)
-#             data[key] = value.strip('"')
+    os_release = _read_os_release()
+    id_like = os_release.get("ID_LIKE", "").lower()
+    distro_id = os_release.get("ID", "").lower()
+    return "arch" in id_like.split() or "arch" in distro_id
 
-#     return data
 
-
-# def is_arch_based():
-#     os_info = get_os_release()
-
-#     id_like = os_info.get("ID_LIKE", "").lower()
-#     distro_id = os_info.get("ID", "").lower()
-
-#     return "arch" in id_like.split() or distro_id == "arch"
+def _read_os_release() -> dict[str, str]:
+    try:
+        text = Path("/etc/os-release").read_text(encoding="utf-8")
+    except OSError:
+        return {}
+
+    data: dict[str, str] = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            data[key.strip()] = value.strip().strip('"\'')
+    return data
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import os
 import shutil
 import subprocess
@@ -21,36 +22,41 @@ _UDEV_RULE_DIRS = [
     Path("/lib/udev/rules.d"),
 ]
 
+_RULES_GLOB = "*.rules"
+_THROTTLE_TOKEN = b'ATTR{idProduct}=="a221"'
+_OTHER_TOKENS = (
+    b'ATTR{idVendor}=="0738"',
+    b'ATTR{idProduct}=="2221"',
+)
+
 
 def should_manage_udev() -> bool:
     return os.name == "posix" and Path("/etc/udev").exists() and os.geteuid() != 0
 
 
+@lru_cache(maxsize=1)
 def has_x56_udev_rule() -> bool:
-    required_tokens = (
-        'ATTR{idVendor}=="0738"',
-        'ATTR{idProduct}=="2221"',
-        'ATTR{idProduct}=="a221"',
-    )
-
     for rules_dir in _UDEV_RULE_DIRS:
         if not rules_dir.exists():
             continue
 
-        for rule_file in rules_dir.glob("*.rules"):
+        for rule_file in rules_dir.glob(_RULES_GLOB):
             try:
-                text = rule_file.read_text(encoding="utf-8", errors="ignore")
+                data = rule_file.read_bytes()
             except OSError:
                 continue
 
-            vendor_present = required_tokens[0] in text
-            joystick_present = required_tokens[1] in text
-            throttle_present = required_tokens[2] in text
-            if vendor_present and joystick_present and throttle_present:
+            if _THROTTLE_TOKEN not in data:
+                continue
+            if all(token in data for token in _OTHER_TOKENS):
                 return True
     return False
 
 
+def invalidate_cache() -> None:
+    has_x56_udev_rule.cache_clear()
+
+
 def install_x56_udev_rule() -> tuple[bool, str]:
     if not should_manage_udev():
         return False, "udev rule installation is not needed for this session."
@@ -109,4 +115,5 @@ def install_x56_udev_rule() -> tuple[bool, str]:
             except OSError:
                 pass
 
+    invalidate_cache()
     return True, "udev rule installed. Replug devices if they were already connected."
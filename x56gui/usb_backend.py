@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import threading
 
 import usb.core
 import usb.util
@@ -19,57 +21,106 @@ from .protocol import (
     build_rgb_packet,
 )
 
+_APPLY_PACKET = bytes(build_apply_packet())
+
+_SETUP_ATTEMPTS: tuple[tuple[tuple[int, ...], int], ...] = (
+    ((2, 0), WINDEX_INTERFACE_2),
+    ((2, 0), 2),
+    ((2,), WINDEX_INTERFACE_2),
+    ((2,), 2),
+)
+
 
 class BackendError(Exception):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeviceInfo:
     id: int
     name: str
     bus: int
     address: int
     product_id: int
+    label: str
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceScan:
+    found: tuple[tuple[int, int, int, usb.core.Device], ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class _DeviceEntry:
     info: DeviceInfo
     device: usb.core.Device
+    configured: bool = False
+    working_setup: tuple[tuple[int, ...], int] | None = None
 
 
 class X56UsbBackend:
     def __init__(self) -> None:
         self._entries: list[_DeviceEntry] = []
+        self._by_id: dict[int, _DeviceEntry] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def generation(self) -> int:
+        return self._generation
 
     def refresh(self) -> list[DeviceInfo]:
-        discovered = usb.core.find(find_all=True, idVendor=VENDOR_ID)
-        devices = list(discovered or [])
-        filtered = [
-            dev
-            for dev in devices
-            if int(getattr(dev, "idProduct", 0)) in SUPPORTED_PRODUCTS
-        ]
-        filtered.sort(key=lambda dev: (int(getattr(dev, "bus", 0)), int(getattr(dev, "address", 0))))
+        return self.install(self.scan())
 
+    def scan(self) -> DeviceScan:
+        found: list[tuple[int, int, int, usb.core.Device]] = []
+        try:
+            discovered = usb.core.find(find_all=True, idVendor=VENDOR_ID)
+            for dev in discovered or []:
+                product_id = int(dev.idProduct)
+                if product_id in SUPPORTED_PRODUCTS:
+                    found.append((int(dev.bus or 0), int(dev.address or 0), product_id, dev))
+        except (usb.core.USBError, usb.core.NoBackendError) as exc:
+            details = str(exc).strip()
+            if details:
+                raise BackendError(f"USB device scan failed ({details}).") from exc
+            raise BackendError("USB device scan failed.") from exc
+        found.sort(key=lambda item: (item[0], item[1]))
+        return DeviceScan(tuple(found))
+
+    def install(self, scan: DeviceScan) -> list[DeviceInfo]:
+        with self._lock:
+            return self._install_locked(scan)
+
+    def _install_locked(self, scan: DeviceScan) -> list[DeviceInfo]:
+        previous = {
+            (entry.info.bus, entry.info.address, entry.info.product_id): entry
+            for entry in self._entries
+        }
         entries: list[_DeviceEntry] = []
-        for index, dev in enumerate(filtered, start=1):
-            product_id = int(dev.idProduct)
+        for index, (bus, address, product_id, dev) in enumerate(scan.found, start=1):
+            name = SUPPORTED_PRODUCTS[product_id]
+            known = previous.get((bus, address, product_id))
             entries.append(
                 _DeviceEntry(
                     info=DeviceInfo(
                         id=index,
-                        name=SUPPORTED_PRODUCTS[product_id],
-                        bus=int(getattr(dev, "bus", 0)),
-                        address=int(getattr(dev, "address", 0)),
+                        name=name,
+                        bus=bus,
+                        address=address,
                         product_id=product_id,
+                        label=f"{index}: {name} (bus {bus}, device {address})",
                     ),
                     device=dev,
+                    configured=known is not None and known.configured,
+                    working_setup=known.working_setup if known is not None else None,
                 )
             )
 
         self._entries = entries
+        self._by_id = {entry.info.id: entry for entry in entries}
+        self._generation += 1
         return [entry.info for entry in entries]
 
     def set_rgb(self, device_id: int, red: int, green: int, blue: int) -> int:
@@ -86,12 +137,34 @@ class X56UsbBackend:
         blue: int,
         calibrations: dict[int, ColorCalibration] | None = None,
         calibration_target: str | None = None,
+        generation: int | None = None,
+    ) -> tuple[int, list[str]]:
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return 0, []
+            return self._set_rgb_many_locked(
+                device_ids,
+                red,
+                green,
+                blue,
+                calibrations,
+                calibration_target,
+            )
+
+    def _set_rgb_many_locked(
+        self,
+        device_ids: list[int],
+        red: int,
+        green: int,
+        blue: int,
+        calibrations: dict[int, ColorCalibration] | None,
+        calibration_target: str | None,
     ) -> tuple[int, list[str]]:
         self._validate_rgb(red, green, blue)
         calibration_map = calibrations or {}
 
         if not self._entries:
-            self.refresh()
+            self._install_locked(self.scan())
         if not self._entries:
             raise BackendError("No compatible X-56 devices found.")
 
@@ -101,31 +174,48 @@ class X56UsbBackend:
         if 0 in device_ids:
             targets = list(self._entries)
         else:
-            wanted = set(device_ids)
-            targets = [entry for entry in self._entries if entry.info.id in wanted]
+            by_id = self._by_id
+            targets = [by_id[device_id] for device_id in dict.fromkeys(device_ids) if device_id in by_id]
 
         if not targets:
             raise BackendError("Selected device ids were not found.")
 
-        apply_packet = build_apply_packet()
+        target_name = calibration_target
+        if calibration_map and not target_name:
+            target_name = ColorCalibration.closest_target_name(red, green, blue)
 
-        applied = 0
-        failures: list[str] = []
-        for entry in targets:
-            try:
+        if not calibration_map:
+            rgb_packet = build_rgb_packet(red, green, blue)
+            jobs = [(entry, rgb_packet) for entry in targets]
+        else:
+            jobs = []
+            for entry in targets:
                 calibration = calibration_map.get(entry.info.id)
                 if calibration is not None:
-                    target_name = calibration_target or calibration.closest_target_name(red, green, blue)
                     out_r, out_g, out_b = calibration.apply(red, green, blue, target_name=target_name)
                 else:
                     out_r, out_g, out_b = red, green, blue
+                jobs.append((entry, build_rgb_packet(out_r, out_g, out_b)))
 
-                rgb_packet = build_rgb_packet(out_r, out_g, out_b)
-                self._set_rgb_single(entry.device, rgb_packet, apply_packet)
-                applied += 1
-            except BackendError as exc:
-                failures.append(f"Device {entry.info.id} ({entry.info.name}): {exc}")
-        return applied, failures
+        if len(jobs) == 1:
+            results = [self._try_one(*jobs[0])]
+        else:
+            results = list(self._get_executor().map(lambda job: self._try_one(*job), jobs))
+
+        failures = [error for error in results if error is not None]
+        return len(results) - len(failures), failures
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="x56-usb")
+        return self._executor
+
+    def _try_one(self, entry: _DeviceEntry, rgb_packet: bytearray) -> str | None:
+        try:
+            self._set_rgb_single(entry, rgb_packet, _APPLY_PACKET)
+        except BackendError as exc:
+            return f"Device {entry.info.id} ({entry.info.name}): {exc}"
+        return None
 
     @staticmethod
     def _validate_rgb(red: int, green: int, blue: int) -> None:
@@ -135,21 +225,26 @@ class X56UsbBackend:
 
     def _set_rgb_single(
         self,
-        device: usb.core.Device,
+        entry: _DeviceEntry,
         rgb_packet: bytearray,
-        apply_packet: bytearray,
+        apply_packet: bytes,
     ) -> None:
-        attempts = [
-            ([2, 0], WINDEX_INTERFACE_2),
-            ([2, 0], 2),
-            ([2], WINDEX_INTERFACE_2),
-            ([2], 2),
-        ]
-
         last_error: BackendError | None = None
-        for interfaces, windex in attempts:
+        learned = entry.working_setup
+        if learned is not None:
             try:
-                self._send_rgb_with_setup(device, interfaces, windex, rgb_packet, apply_packet)
+                self._send_rgb_with_setup(entry, learned[0], learned[1], rgb_packet, apply_packet)
+                return
+            except BackendError as exc:
+                entry.working_setup = None
+                last_error = exc
+
+        for setup in _SETUP_ATTEMPTS:
+            if setup == learned:
+                continue
+            try:
+                self._send_rgb_with_setup(entry, setup[0], setup[1], rgb_packet, apply_packet)
+                entry.working_setup = setup
                 return
             except BackendError as exc:
                 last_error = exc
@@ -160,19 +255,22 @@ class X56UsbBackend:
 
     def _send_rgb_with_setup(
         self,
-        device: usb.core.Device,
-        interfaces: list[int],
+        entry: _DeviceEntry,
+        interfaces: tuple[int, ...],
         windex: int,
         rgb_packet: bytearray,
-        apply_packet: bytearray,
+        apply_packet: bytes,
     ) -> None:
+        device = entry.device
         attached_ifaces: list[int] = []
 
         try:
-            try:
-                device.set_configuration()
-            except usb.core.USBError:
-                pass
+            if not entry.configured:
+                try:
+                    device.set_configuration()
+                except usb.core.USBError:
+                    pass
+                entry.configured = True
 
             for iface in interfaces:
                 if self._kernel_active(device, iface):